@@ -1,7 +1,6 @@
 from flask import jsonify
 from flask_restx import Namespace, Resource
-import os
-from database.db import get_connection
+from services.healthmonitor import monitor
 
 health_ns = Namespace("health", description="헬스체크 API")
 
@@ -18,27 +17,34 @@ class HealthCheck(Resource):
 @health_ns.route("/status")
 class StatusCheck(Resource):
     def get(self):
-        # 간단한 상태 체크 (문제 진단용)
+        # 상태 체크 (문제 진단용) - 백그라운드 모니터의 캐시만 읽음
+        # (app.py __main__ 이 아닌 WSGI 서버로 띄운 경우를 위해 첫 요청에서 모니터 시작, 이후엔 no-op)
+        monitor.start()
+        checks = monitor.snapshot()
+        ready = monitor.is_ready(checks)
+        all_up = all(c["status"] == "up" for c in checks.values())
+
         status = {
-            "status": "healthy",
+            "status": "healthy" if all_up else ("degraded" if ready else "unhealthy"),
             "service": "OldYoung AI Service",
             "checks": {
-                "flask": {"status": "up", "message": "Flask app running"}
+                "flask": {"status": "up", "message": "Flask app running"},
+                **checks,
             }
         }
-        
-        # 데이터베이스 간단 체크 (실패해도 503 반환 안함)
-        try:
-            conn = get_connection()
-            conn.close()
-            status["checks"]["database"] = {
-                "status": "up",
-                "message": "Database accessible"
-            }
-        except Exception as e:
-            status["checks"]["database"] = {
-                "status": "warning",
-                "message": "Database connection issue"
-            }
 
-        return status, 200
\ No newline at end of file
+        # 진단용이므로 항상 200 (트래픽 제외 판단은 /ready 에서)
+        return status, 200
+
+@health_ns.route("/ready")
+class ReadinessCheck(Resource):
+    def get(self):
+        # critical 의존성이 down/unknown/stale 이면 503 → 로드밸런서가 트래픽 제외
+        monitor.start()
+        checks = monitor.snapshot()
+        ready = monitor.is_ready(checks)
+        return {
+            "status": "ready" if ready else "not_ready",
+            "service": "OldYoung AI Service",
+            "checks": {name: c for name, c in checks.items() if c["critical"]},
+        }, 200 if ready else 503
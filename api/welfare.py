@@ -1,6 +1,5 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
-from services.welfareLLM import summarize_welfare_info
 from services.welfareAPI import fetch_welfare_info
 # namespace 직접 생성
 welfare_ns = Namespace("welfare", description="지역 복지 정보 검색 API")
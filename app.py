@@ -4,6 +4,7 @@ from flask_cors import CORS
 from api.income import income_ns
 from api.welfare import welfare_ns
 from api.health import health_ns
+from services.healthmonitor import monitor as health_monitor
 
 app = Flask(__name__)
 CORS(app)
@@ -15,4 +16,6 @@ api.add_namespace(health_ns, path='/health')
 
 
 if __name__ == "__main__":
+    # 의존성 헬스 모니터 (백그라운드 probe 스레드) - import 시점이 아닌 서버 기동 시 시작
+    health_monitor.start()
     app.run(host="0.0.0.0", port=3000, debug=False)
\ No newline at end of file
@@ -0,0 +1,112 @@
+# benchmark/import_profile.py
+"""
+콜드 스타트 import 시간 측정.
+
+각 대상 모듈을 새 인터프리터에서 import 하면서 `python -X importtime` 결과를 모으고,
+요청 경로 밖의 무거운 의존성(langchain, faiss, openai 등)이 import 시점에
+끌려오지 않는지 확인한다. 무거운 모듈이 로드되면 종료 코드 1을 반환한다.
+
+사용법 (프로젝트 루트에서):
+    python benchmark/import_profile.py
+    python benchmark/import_profile.py --top 20 app api.income
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+DEFAULT_TARGETS = ["app", "api.income", "api.welfare", "api.health"]
+
+# import 시점에 로드되면 안 되는 최상위 패키지
+HEAVY_MODULES = [
+    "langchain",
+    "langchain_core",
+    "langchain_openai",
+    "langchain_community",
+    "faiss",
+    "openai",
+    "duckduckgo_search",
+    "tiktoken",
+]
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - t0
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print("__PROFILE__" + json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, str]]:
+    """`-X importtime` 출력에서 (누적 us, 모듈명) 목록을 추출."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1].strip())
+        except ValueError:
+            continue  # 헤더 줄
+        rows.append((cumulative, parts[2].strip()))
+    return rows
+
+
+def profile_target(target: str) -> Dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(target=target, heavy=HEAVY_MODULES)],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    result = {"target": target, "ok": proc.returncode == 0}
+    for line in proc.stdout.splitlines():
+        if line.startswith("__PROFILE__"):
+            result.update(json.loads(line[len("__PROFILE__"):]))
+    if not result["ok"]:
+        result["error"] = proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "unknown"
+    result["slowest"] = sorted(_parse_importtime(proc.stderr), reverse=True)
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="모듈 import 시간 프로파일")
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS)
+    parser.add_argument("--top", type=int, default=10, help="누적 시간 상위 N개 모듈 출력")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    results = [profile_target(t) for t in args.targets]
+    failed = False
+
+    if args.json:
+        for r in results:
+            r["slowest"] = r["slowest"][:args.top]
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        for r in results:
+            if not r["ok"]:
+                print(f"[{r['target']}] import 실패: {r['error']}")
+                continue
+            print(f"[{r['target']}] {r['elapsed'] * 1000:.1f} ms")
+            for cumulative, name in r["slowest"][:args.top]:
+                print(f"    {cumulative / 1000:8.1f} ms  {name}")
+            if r["heavy"]:
+                print(f"    !! import 시점에 무거운 모듈 로드됨: {', '.join(r['heavy'])}")
+
+    for r in results:
+        if not r["ok"] or r.get("heavy"):
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-def get_connection():
+def get_connection(**overrides):
+    """overrides: psycopg2.connect 인자 덮어쓰기 (예: 헬스체크용 짧은 connect_timeout)"""
     host = os.getenv("PG_HOST", "127.0.0.1")
     port = int(os.getenv("PG_PORT", "5432"))
     db   = os.getenv("PG_DB", "postgres")
@@ -13,7 +14,7 @@ def get_connection():
     pwd  = os.getenv("PG_PASSWORD", "")
     sslmode = os.getenv("PG_SSLMODE", "disable")
 
-    conn = psycopg2.connect(
+    params = dict(
         host=host,
         port=port,
         dbname=db,
@@ -26,6 +27,8 @@ def get_connection():
         keepalives_interval=int(os.getenv("PG_KEEPALIVES_INTERVAL", "10")),
         keepalives_count=int(os.getenv("PG_KEEPALIVES_COUNT", "5")),
     )
+    params.update(overrides)
+    conn = psycopg2.connect(**params)
     # 윈도우 콘솔 한글 깨짐 방지
     conn.set_client_encoding("UTF8")
     return conn
@@ -0,0 +1,636 @@
+# database/maintenance.py
+"""
+welfare_item / incomebreaket / incomesnapshot 테이블 수명주기 관리 (CLI 작업).
+
+- migrate : created_at 컬럼 추가 후 월 단위 RANGE 파티션 테이블로 전환
+            (welfare_item 은 월 파티션 아래 city HASH 서브파티션)
+- compact : welfare_item 을 (city, age, 서비스) 별 최신 1건만 남기고 정리
+- purge   : 보존기간이 지난 행을 gzip JSONL 로 보관한 뒤 삭제 (만료된 월 파티션은 DROP)
+- run     : 앞으로 쓸 파티션 미리 생성 + compact + purge (cron/Jenkins 주기 작업용)
+
+사용법 (프로젝트 루트에서):
+    python -m database.maintenance migrate --assume-created-at 2025-01-01
+    python -m database.maintenance migrate --table welfare_item --created-at-from reg_date
+    python -m database.maintenance run --dry-run
+    python -m database.maintenance purge --table welfare_item --retention-days 30
+"""
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+from dotenv import load_dotenv
+from psycopg2 import sql
+
+from database.db import get_connection
+
+load_dotenv()
+
+WELFARE_TABLE = "welfare_item"
+# incomesnapshot 이 incomebreaket 을 참조하므로 snapshot 을 먼저 정리한다
+TABLES = [WELFARE_TABLE, "incomesnapshot", "incomebreaket"]
+
+RETENTION_DAYS = {
+    "welfare_item": int(os.getenv("RETENTION_DAYS_WELFARE", "90")),
+    "incomesnapshot": int(os.getenv("RETENTION_DAYS_INCOME", "365")),
+    "incomebreaket": int(os.getenv("RETENTION_DAYS_INCOME", "365")),
+}
+ARCHIVE_DIR = os.getenv(
+    "MAINTENANCE_ARCHIVE_DIR",
+    os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "archive")),
+)
+CITY_HASH_PARTITIONS = int(os.getenv("WELFARE_CITY_PARTITIONS", "8"))
+MONTHS_AHEAD = int(os.getenv("PARTITION_MONTHS_AHEAD", "3"))
+
+# 아직 참조 중인 행은 지우지 않는다 (snapshot 과 breaket 의 created_at 이 경계에서 어긋날 수 있음)
+_PURGE_GUARDS = {
+    "incomebreaket": sql.SQL(
+        "NOT EXISTS (SELECT 1 FROM incomesnapshot s WHERE s.incomebreaket_id = t.id)"
+    ),
+}
+
+_PARTITION_NAME = re.compile(r"_p(\d{4})_(\d{2})$")
+
+# --created-at-from 없이 created_at 을 채울 때 허용하는 기존 컬럼 이름.
+# 마감일/생년월일 같은 다른 의미의 날짜가 생성 시각으로 쓰이지 않도록 이름으로만 고른다
+CREATED_AT_CANDIDATES = [
+    "created", "created_on", "created_date", "create_date",
+    "inserted_at", "insert_date", "registered_at", "reg_date", "regdate", "reg_dt",
+]
+
+
+# ---------------------------------------------------------------------------
+# 공통 헬퍼
+# ---------------------------------------------------------------------------
+
+def _add_months(d: date, n: int) -> date:
+    y, m = divmod(d.month - 1 + n, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def _table_kind(cur, table: str) -> Optional[str]:
+    """'r' = 일반 테이블, 'p' = 파티션 테이블, None = 없음"""
+    cur.execute(
+        """
+        SELECT c.relkind
+        FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'public' AND c.relname = %s
+        """,
+        (table,),
+    )
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def _columns(cur, table: str) -> List[str]:
+    cur.execute(
+        """
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = %s
+        ORDER BY ordinal_position
+        """,
+        (table,),
+    )
+    return [r[0] for r in cur.fetchall()]
+
+
+def _partitions(cur, table: str) -> List[str]:
+    cur.execute(
+        """
+        SELECT c.relname
+        FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+        WHERE i.inhparent = to_regclass(%s)
+        ORDER BY c.relname
+        """,
+        (f"public.{table}",),
+    )
+    return [r[0] for r in cur.fetchall()]
+
+
+def _in_transaction(rollback: bool, func: Callable, *args, **kwargs):
+    """작업 단위마다 별도 트랜잭션. rollback 이면 끝에 롤백 (--dry-run).
+    kwargs 는 그대로 func 에 넘기므로 func 의 dry_run 인자와 이름이 겹치지 않게 한다."""
+    conn = get_connection()
+    try:
+        result = func(conn, *args, **kwargs)
+        if rollback:
+            conn.rollback()
+        else:
+            conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """CLI --assume-created-at 값 (ISO 날짜/시각). 시간대가 없으면 UTC 로 본다."""
+    ts = datetime.fromisoformat(value)
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _timestamp_columns(cur, table: str) -> List[str]:
+    cur.execute(
+        """
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = %s AND column_name <> 'created_at'
+          AND data_type IN ('timestamp with time zone', 'timestamp without time zone', 'date')
+        ORDER BY ordinal_position
+        """,
+        (table,),
+    )
+    return [r[0] for r in cur.fetchall()]
+
+
+def _pick_created_at_source(date_columns: List[str], created_at_from: Optional[str] = None) -> Optional[str]:
+    """created_at 을 채울 기존 컬럼 선택. 명시한 컬럼이 우선, 없으면 CREATED_AT_CANDIDATES 에서만 고른다."""
+    if created_at_from:
+        if created_at_from not in date_columns:
+            raise RuntimeError(f"--created-at-from {created_at_from}: 날짜/시각 타입 컬럼이 아니거나 없음")
+        return created_at_from
+    for name in CREATED_AT_CANDIDATES:
+        if name in date_columns:
+            return name
+    return None
+
+
+def ensure_created_at(conn, table: str, assume_created_at: Optional[datetime] = None,
+                      created_at_from: Optional[str] = None) -> None:
+    """
+    created_at 컬럼 추가 + 기존 행 채우기.
+    1) created_at_from 컬럼 (또는 CREATED_AT_CANDIDATES 에 있는 이름의 컬럼) 값으로 채운다
+    2) 남은 행은 assume_created_at 으로 채운다. 값이 없으면 예외 (now() 로 채우면
+       기존 행 전부가 새 데이터로 취급돼 보존기간 동안 정리되지 않기 때문)
+    """
+    with conn.cursor() as cur:
+        kind = _table_kind(cur, table)
+        if kind is None:
+            print(f"[{table}] 테이블 없음 - 건너뜀")
+            return
+        if "created_at" in _columns(cur, table):
+            return
+
+        source = _pick_created_at_source(_timestamp_columns(cur, table), created_at_from)
+
+        t = sql.Identifier(table)
+        cur.execute(sql.SQL("ALTER TABLE {} ADD COLUMN created_at timestamptz").format(t))
+
+        if source:
+            cur.execute(sql.SQL("UPDATE {} SET created_at = {}::timestamptz").format(t, sql.Identifier(source)))
+            print(f"[{table}] created_at 을 {source} 컬럼 값으로 채움 ({cur.rowcount}행)")
+
+        cur.execute(sql.SQL("SELECT count(*) FROM {} WHERE created_at IS NULL").format(t))
+        missing = cur.fetchone()[0]
+        if missing:
+            if assume_created_at is None:
+                raise RuntimeError(
+                    f"[{table}] 생성 시각을 알 수 없는 기존 행 {missing}건 - "
+                    "--created-at-from 또는 --assume-created-at 을 지정하세요"
+                )
+            cur.execute(sql.SQL("UPDATE {} SET created_at = %s WHERE created_at IS NULL").format(t),
+                        (assume_created_at,))
+            print(f"[{table}] 기존 행 {missing}건 created_at = {assume_created_at.isoformat()}")
+
+        cur.execute(sql.SQL(
+            "ALTER TABLE {} ALTER COLUMN created_at SET DEFAULT now(), ALTER COLUMN created_at SET NOT NULL"
+        ).format(t))
+        if kind == "r":
+            cur.execute(sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} (created_at)").format(
+                sql.Identifier(f"{table}_created_at_idx"), t))
+        print(f"[{table}] created_at 컬럼 추가")
+
+
+# ---------------------------------------------------------------------------
+# 파티셔닝
+# ---------------------------------------------------------------------------
+
+def _create_partition(cur, parent: str, table: str, month: date) -> None:
+    """parent 아래에 table 기준 이름(<table>_pYYYY_MM)으로 월 파티션 생성."""
+    name = f"{table}_p{month:%Y_%m}"
+    lo, hi = month.isoformat(), _add_months(month, 1).isoformat()
+    by_city = table == WELFARE_TABLE
+    cur.execute(sql.SQL("CREATE TABLE {} PARTITION OF {} FOR VALUES FROM (%s) TO (%s){}").format(
+        sql.Identifier(name), sql.Identifier(parent),
+        sql.SQL(" PARTITION BY HASH (city)" if by_city else "")), (lo, hi))
+    if by_city:
+        for r in range(CITY_HASH_PARTITIONS):
+            cur.execute(sql.SQL(
+                "CREATE TABLE {} PARTITION OF {} FOR VALUES WITH (MODULUS %s, REMAINDER %s)"
+            ).format(sql.Identifier(f"{name}_h{r}"), sql.Identifier(name)), (CITY_HASH_PARTITIONS, r))
+
+
+def _create_month_partition(cur, table: str, month: date) -> None:
+    name = f"{table}_p{month:%Y_%m}"
+    if name in _partitions(cur, table):
+        return
+    lo, hi = month.isoformat(), _add_months(month, 1).isoformat()
+    default = f"{table}_default"
+
+    # default 파티션에 해당 월 행이 있으면 새 파티션 생성이 실패하므로 먼저 빼낸다
+    moved = False
+    if default in _partitions(cur, table):
+        cur.execute(sql.SQL(
+            "SELECT 1 FROM {} WHERE created_at >= %s AND created_at < %s LIMIT 1"
+        ).format(sql.Identifier(default)), (lo, hi))
+        if cur.fetchone():
+            cur.execute(sql.SQL("CREATE TEMP TABLE _moved (LIKE {}) ON COMMIT DROP").format(
+                sql.Identifier(default)))
+            cur.execute(sql.SQL(
+                "WITH d AS (DELETE FROM {} WHERE created_at >= %s AND created_at < %s RETURNING *) "
+                "INSERT INTO _moved SELECT * FROM d"
+            ).format(sql.Identifier(default)), (lo, hi))
+            moved = True
+
+    _create_partition(cur, table, table, month)
+
+    if moved:
+        cur.execute(sql.SQL("INSERT INTO {} OVERRIDING SYSTEM VALUE SELECT * FROM _moved").format(
+            sql.Identifier(table)))
+        cur.execute("DROP TABLE _moved")
+    print(f"[{table}] 파티션 생성: {name}")
+
+
+def ensure_partitions(conn, table: str, months_ahead: int = MONTHS_AHEAD) -> None:
+    """이번 달 ~ months_ahead 개월 뒤 파티션, 그리고 default 에 쌓인 월의 파티션을 만든다."""
+    with conn.cursor() as cur:
+        if _table_kind(cur, table) != "p":
+            return
+        this_month = date.today().replace(day=1)
+        months = {_add_months(this_month, i) for i in range(months_ahead + 1)}
+
+        default = f"{table}_default"
+        if default in _partitions(cur, table):
+            cur.execute(sql.SQL(
+                "SELECT DISTINCT date_trunc('month', created_at)::date FROM {}"
+            ).format(sql.Identifier(default)))
+            months.update(r[0] for r in cur.fetchall())
+
+        for month in sorted(months):
+            _create_month_partition(cur, table, month)
+
+
+def _migration_blockers(cur, table: str) -> List[str]:
+    """파티션 전환 시 옮겨 줄 수 없는 객체 목록 (있으면 전환하지 않는다)."""
+    reg = f"public.{table}"
+    blockers = []
+    cur.execute("SELECT tgname FROM pg_trigger WHERE tgrelid = to_regclass(%s) AND NOT tgisinternal", (reg,))
+    blockers += [f"트리거 {r[0]}" for r in cur.fetchall()]
+    cur.execute("SELECT polname FROM pg_policy WHERE polrelid = to_regclass(%s)", (reg,))
+    blockers += [f"RLS 정책 {r[0]}" for r in cur.fetchall()]
+    # 파티션 테이블의 UNIQUE 는 파티션 키를 포함해야 하므로 그대로 옮길 수 없다
+    cur.execute(
+        """
+        SELECT ic.relname FROM pg_index i JOIN pg_class ic ON ic.oid = i.indexrelid
+        WHERE i.indrelid = to_regclass(%s) AND i.indisunique AND NOT i.indisprimary
+        """,
+        (reg,),
+    )
+    blockers += [f"UNIQUE 인덱스 {r[0]}" for r in cur.fetchall()]
+    cur.execute(
+        """
+        SELECT a.attname FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+        WHERE i.indrelid = to_regclass(%s) AND i.indisprimary
+        """,
+        (reg,),
+    )
+    pk = [r[0] for r in cur.fetchall()]
+    if pk and pk != ["id"]:
+        blockers.append(f"PK ({', '.join(pk)})")
+    return blockers
+
+
+def convert_to_partitioned(conn, table: str, keep_legacy: bool = False,
+                           assume_created_at: Optional[datetime] = None,
+                           created_at_from: Optional[str] = None) -> None:
+    """
+    일반 테이블 → created_at 기준 월 RANGE 파티션 테이블 (한 트랜잭션 안에서 복사 후 교체).
+    소유자, GRANT, 테이블/컬럼 코멘트, 일반 인덱스, FK 는 새 테이블로 옮긴다.
+    다른 테이블이 FK 로 참조 중이면(예: incomesnapshot → incomebreaket) 전환하지 않고,
+    트리거/RLS 정책/UNIQUE 인덱스/id 외 PK 처럼 옮길 수 없는 객체가 있으면 예외를 낸다.
+    """
+    ensure_created_at(conn, table, assume_created_at, created_at_from)
+    with conn.cursor() as cur:
+        kind = _table_kind(cur, table)
+        if kind is None:
+            return
+        if kind == "p":
+            print(f"[{table}] 이미 파티션 테이블")
+            return
+
+        reg = f"public.{table}"
+        cur.execute(
+            "SELECT conname, conrelid::regclass::text FROM pg_constraint "
+            "WHERE contype = 'f' AND confrelid = to_regclass(%s)",
+            (reg,),
+        )
+        referencing = cur.fetchall()
+        if referencing:
+            refs = ", ".join(f"{rel}.{name}" for name, rel in referencing)
+            print(f"[{table}] FK 참조({refs}) 때문에 파티션 전환 생략 - 보존기간 정리만 적용")
+            return
+
+        blockers = _migration_blockers(cur, table)
+        if blockers:
+            raise RuntimeError(f"[{table}] 파티션 전환 불가 - 옮길 수 없는 객체: {', '.join(blockers)}")
+
+        # 옮겨 붙일 FK 정의 (LIKE 는 CHECK 제약만 복사한다)
+        cur.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE contype = 'f' AND conrelid = to_regclass(%s)",
+            (reg,),
+        )
+        foreign_keys = cur.fetchall()
+        cur.execute("SELECT pg_get_serial_sequence(%s, 'id')", (reg,))
+        serial_seq = cur.fetchone()[0]
+        # UNIQUE 가 아닌 인덱스 (PK/UNIQUE 는 위에서 처리하거나 막았음)
+        cur.execute(
+            """
+            SELECT ic.relname, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i JOIN pg_class ic ON ic.oid = i.indexrelid
+            WHERE i.indrelid = to_regclass(%s) AND NOT i.indisunique
+            """,
+            (reg,),
+        )
+        indexes = cur.fetchall()
+        cur.execute(
+            """
+            SELECT CASE WHEN a.grantee = 0 THEN 'PUBLIC' ELSE a.grantee::regrole::text END,
+                   a.privilege_type, a.is_grantable
+            FROM pg_class c, aclexplode(c.relacl) a
+            WHERE c.oid = to_regclass(%s)
+            """,
+            (reg,),
+        )
+        grants = cur.fetchall()
+        cur.execute(
+            "SELECT pg_get_userbyid(relowner), obj_description(oid, 'pg_class'), current_user "
+            "FROM pg_class WHERE oid = to_regclass(%s)",
+            (reg,),
+        )
+        owner, table_comment, current_user = cur.fetchone()
+
+        new = f"{table}__new"
+        t, n = sql.Identifier(table), sql.Identifier(new)
+        cur.execute(sql.SQL(
+            "CREATE TABLE {} (LIKE {} INCLUDING DEFAULTS INCLUDING IDENTITY INCLUDING CONSTRAINTS "
+            "INCLUDING COMMENTS INCLUDING STORAGE) PARTITION BY RANGE (created_at)"
+        ).format(n, t))
+        # 앱 계정이 계속 INSERT 할 수 있도록 소유자/권한을 그대로 옮긴다
+        # (소유자 변경 권한이 없으면 여기서 실패하고 전체가 롤백된다)
+        if owner != current_user:
+            cur.execute(sql.SQL("ALTER TABLE {} OWNER TO {}").format(n, sql.Identifier(owner)))
+        for grantee, privilege, grantable in grants:
+            cur.execute(sql.SQL("GRANT {} ON {} TO {}{}").format(
+                sql.SQL(privilege), n,
+                sql.SQL(grantee),  # regrole::text 는 이미 필요한 경우 따옴표 처리됨
+                sql.SQL(" WITH GRANT OPTION" if grantable else "")))
+        if table_comment is not None:
+            cur.execute(sql.SQL("COMMENT ON TABLE {} IS %s").format(n), (table_comment,))
+        # 파티션 테이블의 PK 는 모든 파티션 키를 포함해야 한다
+        pk_cols = ["id", "created_at"]
+        if table == WELFARE_TABLE:
+            # city 서브파티션 키도 PK 에 들어가므로 NULL city 를 '' 로 정리하고 NOT NULL 로 바꾼다
+            # (save_welfare_item 도 빈 city 를 '' 로 저장)
+            cur.execute(sql.SQL("UPDATE {} SET city = '' WHERE city IS NULL").format(t))
+            cur.execute(sql.SQL("ALTER TABLE {} ALTER COLUMN city SET NOT NULL").format(n))
+            pk_cols.append("city")
+        cur.execute(sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} PRIMARY KEY ({})").format(
+            n, sql.Identifier(f"{table}_part_pkey"), sql.SQL(", ").join(sql.Identifier(c) for c in pk_cols)))
+
+        cur.execute(sql.SQL("CREATE TABLE {} PARTITION OF {} DEFAULT").format(
+            sql.Identifier(f"{table}_default"), n))
+        cur.execute(sql.SQL("SELECT min(created_at)::date FROM {}").format(t))
+        oldest = cur.fetchone()[0] or date.today()
+        month = oldest.replace(day=1)
+        last = _add_months(date.today().replace(day=1), MONTHS_AHEAD)
+        while month <= last:
+            # 파티션 이름은 최종 테이블 이름 기준으로 만든다
+            _create_partition(cur, new, table, month)
+            month = _add_months(month, 1)
+
+        cur.execute(sql.SQL("INSERT INTO {} OVERRIDING SYSTEM VALUE SELECT * FROM {}").format(n, t))
+        copied = cur.rowcount
+
+        for conname, condef in foreign_keys:
+            cur.execute(sql.SQL("ALTER TABLE {} ADD CONSTRAINT {} {}").format(
+                n, sql.Identifier(conname), sql.SQL(condef)))
+
+        if serial_seq:
+            # serial 시퀀스는 기존 컬럼 소유라 DROP 시 같이 지워지므로 소유권을 넘긴다
+            cur.execute(sql.SQL("ALTER SEQUENCE {} OWNED BY {}.id").format(sql.SQL(serial_seq), n))
+        else:
+            cur.execute("SELECT pg_get_serial_sequence(%s, 'id')", (f"public.{new}",))
+            identity_seq = cur.fetchone()[0]
+            if identity_seq:
+                cur.execute(sql.SQL("SELECT setval(%s, (SELECT coalesce(max(id), 0) + 1 FROM {}), false)").format(n),
+                            (identity_seq,))
+
+        if keep_legacy:
+            cur.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(t, sql.Identifier(f"{table}_legacy")))
+            # 인덱스 이름을 새 테이블에서 다시 쓰기 위해 legacy 쪽 이름을 비켜 준다
+            for name, _ in indexes:
+                cur.execute(sql.SQL("ALTER INDEX {} RENAME TO {}").format(
+                    sql.Identifier(name), sql.Identifier(f"{name}_legacy")))
+        else:
+            cur.execute(sql.SQL("DROP TABLE {}").format(t))
+        cur.execute(sql.SQL("ALTER TABLE {} RENAME TO {}").format(n, t))
+
+        # 일반 인덱스를 같은 이름/정의로 파티션 부모에 다시 만든다 (각 파티션에 전파됨)
+        for name, indexdef in indexes:
+            _, using = indexdef.split(" USING ", 1)
+            cur.execute(sql.SQL("CREATE INDEX {} ON {} USING {}").format(
+                sql.Identifier(name), t, sql.SQL(using)))
+        if indexes:
+            print(f"[{table}] 인덱스 {len(indexes)}개 재생성: {', '.join(name for name, _ in indexes)}")
+        print(f"[{table}] 파티션 테이블로 전환 완료 ({copied}행 복사)")
+
+
+# ---------------------------------------------------------------------------
+# 정리 (compaction / retention)
+# ---------------------------------------------------------------------------
+
+def compact_welfare(conn, table: str = WELFARE_TABLE) -> int:
+    """같은 (city, age, 서비스) 카드 중 가장 최근 1건만 남기고 삭제. 삭제 행 수 반환."""
+    with conn.cursor() as cur:
+        cols = _columns(cur, table)
+        if not cols:
+            print(f"[{table}] 테이블 없음 - 건너뜀")
+            return 0
+        # 서비스 식별: 상세 링크(servId 포함) 우선, 없으면 제목
+        key = [sql.Identifier(c) for c in ("city", "age") if c in cols]
+        key.append(sql.SQL("coalesce(link, title)") if "link" in cols else sql.Identifier("title"))
+        order = sql.SQL("created_at DESC, id DESC" if "created_at" in cols else "id DESC")
+
+        cur.execute(sql.SQL(
+            """
+            DELETE FROM {t} t
+            USING (
+                SELECT id, row_number() OVER (PARTITION BY {key} ORDER BY {order}) AS rn
+                FROM {t}
+            ) d
+            WHERE t.id = d.id AND d.rn > 1
+            """
+        ).format(t=sql.Identifier(table), key=sql.SQL(", ").join(key), order=order))
+        deleted = cur.rowcount
+    print(f"[{table}] 중복 카드 {deleted}건 정리")
+    return deleted
+
+
+def _expired_partitions(partitions: List[str], cutoff: date) -> List[str]:
+    """이름(<table>_pYYYY_MM)으로 월을 알 수 있고 그 달 전체가 cutoff 이전인 파티션."""
+    expired = []
+    for part in partitions:
+        m = _PARTITION_NAME.search(part)
+        if not m:
+            continue
+        upper = _add_months(date(int(m.group(1)), int(m.group(2)), 1), 1)
+        if upper <= cutoff:
+            expired.append(part)
+    return expired
+
+
+def _archive_rows(conn, table: str, where: sql.Composable, params, archive_dir: str) -> int:
+    """조건에 맞는 행을 gzip JSONL 로 저장. 저장한 행 수 반환."""
+    os.makedirs(os.path.join(archive_dir, table), exist_ok=True)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    path = os.path.join(archive_dir, table, f"{table}_{stamp}.jsonl.gz")
+    count = 0
+    f = None
+    try:
+        with conn.cursor(name=f"archive_{table}") as rc:
+            rc.itersize = 5000
+            rc.execute(sql.SQL("SELECT * FROM {} t WHERE {} ORDER BY created_at").format(
+                sql.Identifier(table), where), params)
+            for row in rc:
+                if f is None:
+                    cols = [d[0] for d in rc.description]
+                    f = gzip.open(path + ".part", "wt", encoding="utf-8")
+                f.write(json.dumps(dict(zip(cols, row)), ensure_ascii=False, default=str) + "\n")
+                count += 1
+    finally:
+        if f is not None:
+            f.close()
+    if count:
+        os.replace(path + ".part", path)
+        print(f"[{table}] {count}행 보관: {path}")
+    return count
+
+
+def purge_table(conn, table: str, retention_days: int, archive_dir: Optional[str] = ARCHIVE_DIR,
+                dry_run: bool = False) -> int:
+    """
+    retention_days 보다 오래된 행을 (archive_dir 이 있으면 보관 후) 삭제.
+    파티션 테이블은 통째로 만료된 월 파티션을 DROP 하고 나머지를 DELETE 한다.
+    """
+    with conn.cursor() as cur:
+        kind = _table_kind(cur, table)
+        if kind is None or "created_at" not in _columns(cur, table):
+            print(f"[{table}] 테이블 또는 created_at 없음 - migrate 먼저 실행")
+            return 0
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        where = sql.SQL("t.created_at < %s")
+        if table in _PURGE_GUARDS:
+            where = sql.SQL("{} AND {}").format(where, _PURGE_GUARDS[table])
+
+        if dry_run:
+            cur.execute(sql.SQL("SELECT count(*) FROM {} t WHERE {}").format(sql.Identifier(table), where),
+                        (cutoff,))
+            expired = cur.fetchone()[0]
+            print(f"[{table}] (dry-run) {cutoff:%Y-%m-%d} 이전 {expired}행 삭제 예정")
+            return expired
+
+        if archive_dir:
+            _archive_rows(conn, table, where, (cutoff,), archive_dir)
+
+        purged = 0
+        # 참조 가드가 있는 테이블은 파티션 단위로 통째로 지우지 않는다
+        if kind == "p" and table not in _PURGE_GUARDS:
+            for part in _expired_partitions(_partitions(cur, table), cutoff.date()):
+                cur.execute(sql.SQL("SELECT count(*) FROM {}").format(sql.Identifier(part)))
+                purged += cur.fetchone()[0]
+                cur.execute(sql.SQL("DROP TABLE {}").format(sql.Identifier(part)))
+                print(f"[{table}] 만료 파티션 삭제: {part}")
+
+        cur.execute(sql.SQL("DELETE FROM {} t WHERE {}").format(sql.Identifier(table), where), (cutoff,))
+        purged += cur.rowcount
+    print(f"[{table}] 보존기간({retention_days}일) 지난 {purged}행 삭제")
+    return purged
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="welfare/income 테이블 보존·파티션·정리 작업")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def common(p):
+        p.add_argument("--table", action="append", choices=TABLES, help="대상 테이블 (여러 번 지정 가능)")
+        p.add_argument("--dry-run", action="store_true", help="변경 사항을 롤백 (보관 파일도 만들지 않음)")
+        return p
+
+    def assume(p):
+        p.add_argument(
+            "--created-at-from", metavar="COLUMN",
+            help="created_at 컬럼을 새로 만들 때 기존 행의 값을 가져올 날짜/시각 컬럼. "
+                 f"지정하지 않으면 {', '.join(CREATED_AT_CANDIDATES)} 중 있는 컬럼만 사용한다",
+        )
+        p.add_argument(
+            "--assume-created-at", type=_parse_timestamp, metavar="ISO_DATETIME",
+            help="created_at 컬럼을 새로 만들 때, 위 컬럼으로 알 수 없는 기존 행의 생성 시각 "
+                 "(예: 2025-01-01). 지정하지 않았는데 그런 행이 있으면 작업을 중단한다. "
+                 "now 로 채우면 기존 행이 보존기간 내내 정리되지 않으므로 실제 적재 시작 시점에 가깝게 준다",
+        )
+        return p
+
+    p_migrate = assume(common(sub.add_parser("migrate", help="created_at 추가 + 파티션 테이블 전환")))
+    p_migrate.add_argument("--keep-legacy", action="store_true", help="기존 테이블을 <table>_legacy 로 남김")
+    common(sub.add_parser("compact", help="welfare_item 서비스별 최신 1건만 유지"))
+    for name in ("purge", "run"):
+        p = common(sub.add_parser(name, help="보존기간 정리" if name == "purge" else "파티션 생성 + compact + purge"))
+        p.add_argument("--retention-days", type=int, help="테이블별 기본 보존기간 대신 사용")
+        p.add_argument("--archive-dir", default=ARCHIVE_DIR, help="보관 파일 경로")
+        p.add_argument("--no-archive", action="store_true", help="보관 없이 삭제")
+        if name == "run":
+            assume(p)
+
+    args = parser.parse_args(argv)
+    # TABLES 순서 유지 (FK 때문에 snapshot → breaket)
+    tables = [t for t in TABLES if not args.table or t in args.table]
+    dry = args.dry_run
+
+    if args.command == "migrate":
+        for t in tables:
+            _in_transaction(dry, convert_to_partitioned, t, keep_legacy=args.keep_legacy,
+                            assume_created_at=args.assume_created_at, created_at_from=args.created_at_from)
+        return 0
+
+    if args.command == "run":
+        for t in tables:
+            _in_transaction(dry, ensure_created_at, t, args.assume_created_at, args.created_at_from)
+            _in_transaction(dry, ensure_partitions, t)
+
+    if args.command in ("compact", "run") and WELFARE_TABLE in tables:
+        _in_transaction(dry, compact_welfare)
+
+    if args.command in ("purge", "run"):
+        archive_dir = None if args.no_archive else args.archive_dir
+        for t in tables:
+            days = args.retention_days if args.retention_days is not None else RETENTION_DAYS[t]
+            _in_transaction(dry, purge_table, t, days, archive_dir=archive_dir, dry_run=dry)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+# services/healthmonitor.py
+"""
+백그라운드 의존성 헬스 모니터.
+
+각 의존성(Postgres, OpenAI, 벡터스토어, data.go.kr)을 자기 주기로 별도 스레드에서 검사하고
+결과(상태, 메시지, 지연시간, 검사 시각)를 메모리에 캐시한다.
+/health/status, /health/ready 는 이 캐시만 읽으므로 요청마다 외부 연결을 만들지 않는다.
+"""
+import math
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from dotenv import load_dotenv
+
+from database.db import get_connection
+from services import registry
+
+load_dotenv()
+
+PROBE_TIMEOUT = float(os.getenv("HEALTH_PROBE_TIMEOUT", "3"))
+DEFAULT_INTERVAL = float(os.getenv("HEALTH_INTERVAL", "30"))
+# 이 목록의 의존성이 down 이면 readiness 가 503.
+# 인스턴스 로컬 의존성만 둔다: OpenAI/data.go.kr 같은 공용 외부 API 장애로
+# 전체 인스턴스가 동시에 빠지지 않도록, 이들은 /status 에서 degraded 로만 보고한다
+CRITICAL = [s.strip() for s in os.getenv("HEALTH_CRITICAL", "database,vectorstore").split(",") if s.strip()]
+# 마지막 검사가 interval * STALE_FACTOR 보다 오래되면 결과를 신뢰하지 않는다
+STALE_FACTOR = 3
+
+
+class ProbeError(Exception):
+    pass
+
+
+# ---------------------------------------------------------------------------
+# 개별 probe: 정상이면 메시지를 반환, 비정상이면 예외 발생
+# ---------------------------------------------------------------------------
+
+def probe_database() -> str:
+    # 연결과 쿼리 모두 PROBE_TIMEOUT 안에 끝나야 한다 (libpq connect_timeout 은 정수 초)
+    conn = get_connection(
+        connect_timeout=max(2, math.ceil(PROBE_TIMEOUT)),
+        options=f"-c statement_timeout={int(PROBE_TIMEOUT * 1000)}",
+    )
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+            cur.fetchone()
+    finally:
+        conn.close()
+    return "Database accessible"
+
+
+def probe_openai() -> str:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ProbeError("OPENAI_API_KEY 미설정")
+    resp = requests.get(
+        "https://api.openai.com/v1/models",
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=PROBE_TIMEOUT,
+    )
+    if resp.status_code != 200:
+        raise ProbeError(f"OpenAI 응답 코드 {resp.status_code}")
+    return "OpenAI API reachable"
+
+
+def probe_vectorstore() -> str:
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    vector_path = os.path.join(base_dir, "..", "vectorstore", "law_and_welfare")
+    missing = [f for f in ("index.faiss", "index.pkl") if not os.path.isfile(os.path.join(vector_path, f))]
+    if missing:
+        raise ProbeError(f"벡터스토어 파일 없음: {', '.join(missing)}")
+    # 로드 자체는 첫 요청에서 registry 가 수행 (여기서 강제로 로드하지 않음)
+    loaded = "loaded" if registry.is_loaded("vectorstore") else "not loaded yet"
+    return f"Vectorstore index present ({loaded})"
+
+
+def check_data_go_kr_response(resp) -> None:
+    """data.go.kr 응답 검증. 키 오류 등도 HTTP 200 + 오류 XML 로 오므로 본문까지 확인한다."""
+    if resp.status_code != 200:
+        raise ProbeError(f"data.go.kr 응답 코드 {resp.status_code}")
+    try:
+        root = ET.fromstring(resp.text)
+    except ET.ParseError:
+        raise ProbeError("data.go.kr 응답이 XML 이 아님")
+    reason = root.findtext(".//returnReasonCode")
+    if reason is not None and reason.strip() not in ("0", "00"):
+        auth_msg = root.findtext(".//returnAuthMsg") or root.findtext(".//errMsg") or ""
+        raise ProbeError(f"data.go.kr 오류 {reason.strip()} {auth_msg.strip()}".strip())
+    result = root.findtext(".//resultCode")
+    if result is not None and result.strip() not in ("0", "00"):
+        result_msg = root.findtext(".//resultMessage") or ""
+        raise ProbeError(f"data.go.kr resultCode {result.strip()} {result_msg.strip()}".strip())
+    if root.find(".//totalCount") is None and root.find(".//servList") is None:
+        raise ProbeError("data.go.kr 응답에 totalCount/servList 없음")
+
+
+def probe_data_go_kr() -> str:
+    service_key = os.getenv("DATA_SERVICE_KEY")
+    if not service_key:
+        raise ProbeError("DATA_SERVICE_KEY 미설정")
+    resp = requests.get(
+        "http://apis.data.go.kr/B554287/LocalGovernmentWelfareInformations/LcgvWelfarelist",
+        params={"serviceKey": service_key, "pageNo": 1, "numOfRows": 1},
+        timeout=PROBE_TIMEOUT,
+    )
+    check_data_go_kr_response(resp)
+    return "data.go.kr reachable"
+
+
+# ---------------------------------------------------------------------------
+# 모니터
+# ---------------------------------------------------------------------------
+
+class HealthMonitor:
+    def __init__(self):
+        self._probes: Dict[str, Dict[str, Any]] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+
+    def add_probe(self, name: str, func: Callable[[], str], interval: Optional[float] = None) -> None:
+        env_key = f"HEALTH_INTERVAL_{name.upper()}"
+        interval = float(os.getenv(env_key, interval or DEFAULT_INTERVAL))
+        self._probes[name] = {"func": func, "interval": interval}
+        with self._lock:
+            self._results[name] = {
+                "status": "unknown",
+                "message": "아직 검사되지 않음",
+                "latency_ms": None,
+                "checked_at": None,
+                "_checked_ts": None,
+            }
+
+    def start(self) -> None:
+        """probe 별 데몬 스레드 시작. 이미 시작됐으면 무시."""
+        with self._start_lock:
+            if self._threads:
+                return
+            self._stop.clear()
+            for name in self._probes:
+                t = threading.Thread(target=self._loop, args=(name,), name=f"health-{name}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def stop(self) -> None:
+        with self._start_lock:
+            self._stop.set()
+            for t in self._threads:
+                t.join(timeout=PROBE_TIMEOUT)
+            self._threads = []
+
+    def run_once(self, name: str) -> None:
+        func = self._probes[name]["func"]
+        started = time.perf_counter()
+        try:
+            message = func()
+            status = "up"
+        except Exception as e:
+            message = f"{type(e).__name__}: {e}"
+            status = "down"
+        self.record(name, status, message, (time.perf_counter() - started) * 1000)
+
+    def record(self, name: str, status: str, message: str, latency_ms: Optional[float] = None) -> None:
+        """
+        결과 기록. probe 뿐 아니라 실제 요청 경로(예: data.go.kr 조회)도 결과를 남길 수 있고,
+        최근 기록이 있으면 probe 스레드는 그 주기 동안 외부 호출을 생략한다.
+        """
+        if name not in self._probes:
+            return
+        latency_ms = round(latency_ms, 1) if latency_ms is not None else None
+        with self._lock:
+            self._results[name] = {
+                "status": status,
+                "message": message,
+                "latency_ms": latency_ms,
+                "checked_at": datetime.now(timezone.utc).isoformat(),
+                "_checked_ts": time.monotonic(),
+            }
+
+    def seconds_until_due(self, name: str) -> float:
+        """다음 probe 까지 남은 시간. 마지막 기록(probe 또는 실제 트래픽)이 interval 이내면 양수."""
+        with self._lock:
+            checked_ts = self._results[name]["_checked_ts"]
+        if checked_ts is None:
+            return 0.0
+        return self._probes[name]["interval"] - (time.monotonic() - checked_ts)
+
+    def _loop(self, name: str) -> None:
+        while not self._stop.is_set():
+            wait_for = self.seconds_until_due(name)
+            if wait_for <= 0:
+                self.run_once(name)
+                wait_for = self._probes[name]["interval"]
+            self._stop.wait(wait_for)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """캐시된 결과 복사본. 오래된 결과는 status 를 stale 로 표시."""
+        now = time.monotonic()
+        out = {}
+        with self._lock:
+            items = list(self._results.items())
+        for name, result in items:
+            r = {k: v for k, v in result.items() if not k.startswith("_")}
+            checked_ts = result["_checked_ts"]
+            max_age = self._probes[name]["interval"] * STALE_FACTOR
+            if checked_ts is not None and now - checked_ts > max_age:
+                r["status"] = "stale"
+            r["critical"] = name in CRITICAL
+            out[name] = r
+        return out
+
+    def is_ready(self, snapshot: Optional[Dict[str, Dict[str, Any]]] = None) -> bool:
+        """critical 의존성이 모두 up 이어야 ready (unknown/stale 포함 나머지는 not ready)."""
+        snapshot = snapshot if snapshot is not None else self.snapshot()
+        return all(r["status"] == "up" for r in snapshot.values() if r["critical"])
+
+
+monitor = HealthMonitor()
+monitor.add_probe("database", probe_database, interval=15)
+monitor.add_probe("openai", probe_openai, interval=60)
+monitor.add_probe("vectorstore", probe_vectorstore, interval=60)
+# data.go.kr 는 일일 호출 한도가 있으므로 주기를 길게 두고, 실제 조회 결과를 우선 사용한다
+monitor.add_probe("data_go_kr", probe_data_go_kr, interval=900)
@@ -1,39 +1,13 @@
 import json
 import re
 from typing import Any, Dict
-import os
-from dotenv import load_dotenv
 
-from langchain_openai import ChatOpenAI
-from langchain.schema import SystemMessage, HumanMessage
-from langchain_community.vectorstores import FAISS
-from langchain_openai import OpenAIEmbeddings
-
-load_dotenv()
-openai_api_key = os.getenv("OPENAI_API_KEY")
-
-# LLM 초기화
-llm = ChatOpenAI(
-    temperature=0.3,
-    model="gpt-3.5-turbo",
-    openai_api_key=openai_api_key
-)
-
-# Retriever
-
-base_dir = os.path.dirname(os.path.abspath(__file__))  # 현재 incomeLLM.py 기준
-vector_path = os.path.join(base_dir, "..", "vectorstore", "law_and_welfare")
-vectorstore = FAISS.load_local(vector_path,
-                             OpenAIEmbeddings(),
-                             allow_dangerous_deserialization=True)
-retriever = vectorstore.as_retriever()
+from services import registry
 
 
 # 시스템 프롬프트
 def load_income_prompt() -> str:
-    prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompt", "incomeprompt.txt")
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        return f.read()
+    return registry.get("income_prompt")
 
 def _extract_json(text: str) -> Dict[str, Any]:
     """
@@ -99,7 +73,7 @@ def estimate_income_bracket(
             f"소득환산액 공식 "
             f"{housing_type} 거주 공제 기준"
         )
-        relevant_docs = retriever.invoke(query)
+        relevant_docs = registry.get("retriever").invoke(query)
         retrieved_text = "\n\n".join([doc.page_content for doc in relevant_docs])
 
 
@@ -118,6 +92,7 @@ def estimate_income_bracket(
         )
 
         # 4. LangChain 메시지 구성
+        SystemMessage, HumanMessage = registry.get("messages")
         messages = [
             SystemMessage(content=system_prompt),
             HumanMessage(content=(
@@ -128,7 +103,7 @@ def estimate_income_bracket(
         ]
 
         # 5. GPT 응답 생성
-        response = llm.invoke(messages)
+        response = registry.get("llm").invoke(messages)
         raw_text = response.content.strip()
 
         parsed = _extract_json(raw_text)
@@ -0,0 +1,157 @@
+# services/registry.py
+"""
+무거운 의존성(LLM 클라이언트, 검색 도구, 벡터스토어, 프롬프트)을 위한 지연 서비스 레지스트리.
+
+모듈 import 시점에는 팩토리만 등록하고, 실제 객체는 get(name) 최초 호출 때 생성한 뒤
+프로세스 전체에서 공유한다. langchain / faiss 등은 팩토리 안에서만 import 한다.
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 외부 호출 상한 (요청 단위 마감이 있으면 호출하는 쪽에서 더 짧게 넘긴다)
+OPENAI_REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "30"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "1"))
+SEARCH_TIMEOUT = float(os.getenv("WELFARE_SEARCH_TIMEOUT", "10"))
+
+_factories: Dict[str, Callable[[], Any]] = {}
+_instances: Dict[str, Any] = {}
+# _lock 은 딕셔너리 갱신에만 짧게 잡고, 팩토리 실행은 서비스별 락으로 직렬화한다
+# (FAISS 로딩 중에도 llm/search 등 다른 서비스 호출은 기다리지 않음)
+_lock = threading.Lock()
+_locks: Dict[str, threading.RLock] = {}
+
+
+def _lock_for(name: str) -> threading.RLock:
+    with _lock:
+        lock = _locks.get(name)
+        if lock is None:
+            lock = _locks[name] = threading.RLock()
+        return lock
+
+
+def register(name: str):
+    """팩토리 등록 데코레이터. 같은 이름으로 다시 등록하면 캐시된 인스턴스도 버린다."""
+    def decorator(factory: Callable[[], Any]) -> Callable[[], Any]:
+        with _lock:
+            _factories[name] = factory
+            _instances.pop(name, None)
+        return factory
+    return decorator
+
+
+def get(name: str) -> Any:
+    """이름에 해당하는 서비스를 반환. 최초 호출 시 한 번만 생성된다."""
+    try:
+        return _instances[name]
+    except KeyError:
+        pass
+
+    with _lock:
+        factory = _factories.get(name)
+    if factory is None:
+        raise KeyError(f"등록되지 않은 서비스입니다: {name}")
+
+    with _lock_for(name):
+        try:
+            return _instances[name]
+        except KeyError:
+            pass
+        # 팩토리에서 예외가 나면 캐시하지 않으므로 다음 호출에서 재시도된다
+        instance = factory()
+        with _lock:
+            _instances[name] = instance
+        return instance
+
+
+def is_loaded(name: str) -> bool:
+    return name in _instances
+
+
+def reset(name: Optional[str] = None) -> None:
+    """캐시된 인스턴스 제거 (테스트/키 교체용). name이 없으면 전체 제거."""
+    with _lock:
+        if name is None:
+            _instances.clear()
+        else:
+            _instances.pop(name, None)
+
+
+def _read_prompt(filename: str) -> str:
+    prompt_path = os.path.join(_BASE_DIR, "..", "prompt", filename)
+    with open(prompt_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# ---------------------------------------------------------------------------
+# 기본 서비스 팩토리
+# ---------------------------------------------------------------------------
+
+@register("llm")
+def _llm():
+    # 소득분위 추정과 복지 요약이 같은 클라이언트를 공유한다
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(
+        temperature=0.3,
+        model="gpt-3.5-turbo",
+        openai_api_key=os.getenv("OPENAI_API_KEY"),
+        request_timeout=OPENAI_REQUEST_TIMEOUT,
+        max_retries=OPENAI_MAX_RETRIES,
+    )
+
+
+@register("messages")
+def _messages():
+    """(SystemMessage, HumanMessage) - langchain 을 import 시점에 끌어오지 않기 위해 지연 로드."""
+    from langchain.schema import SystemMessage, HumanMessage
+    return SystemMessage, HumanMessage
+
+
+@register("vectorstore")
+def _vectorstore():
+    from langchain_community.vectorstores import FAISS
+    from langchain_openai import OpenAIEmbeddings
+    vector_path = os.path.join(_BASE_DIR, "..", "vectorstore", "law_and_welfare")
+    return FAISS.load_local(vector_path,
+                            OpenAIEmbeddings(),
+                            allow_dangerous_deserialization=True)
+
+
+@register("retriever")
+def _retriever():
+    return get("vectorstore").as_retriever()
+
+
+@register("search")
+def _search():
+    """query -> 검색 스니펫 문자열. DDGS 를 직접 써서 호출마다 timeout 을 줄 수 있게 한다."""
+    from duckduckgo_search import DDGS
+
+    def search(query: str, timeout: float = SEARCH_TIMEOUT) -> str:
+        results = DDGS(timeout=max(1, int(timeout))).text(
+            query,
+            region="kr-kr",      # 지역 편향 최소화 (예: "kr-kr", "us-en"도 가능)
+            safesearch="strict",    # off | moderate | strict
+            timelimit="y",       # d | w | m | y (또는 None)
+            backend="auto",      # api | html | lite | auto
+            max_results=50,      # 더 많이 가져오기
+        )
+        return " ".join(r.get("body", "") for r in results or [])
+
+    return search
+
+
+@register("income_prompt")
+def _income_prompt() -> str:
+    return _read_prompt("incomeprompt.txt")
+
+
+@register("welfare_prompt")
+def _welfare_prompt() -> str:
+    return _read_prompt("welfareprompt.txt")
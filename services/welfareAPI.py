@@ -1,19 +1,42 @@
 from dotenv import load_dotenv
 import os
+import threading
+import time
 import requests
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, wait, FIRST_COMPLETED
 from services.welfareparser import parse_and_format_cards
 from services.welfareLLM import summarize_welfare_info
 from services.welfaredb import save_welfare_item
+from services.healthmonitor import monitor as health_monitor, check_data_go_kr_response
 
 # .env 파일 로드
 load_dotenv()
 SERVICE_KEY = os.getenv("DATA_SERVICE_KEY")
 
-def fetch_welfare_info(
-    age: bool,
-    city: str,
-):
+# 공공데이터 API 와 검색+LLM 요약 설정
+# - WELFARE_API_TIMEOUT: 구조화된 카드(공공데이터 API)만 기다리는 시간. 이 안에 카드가 오면 LLM 은 시작하지 않는다
+# - WELFARE_SOURCE_DEADLINE: 요청 전체 마감 시간 (LLM 요약 대체 포함). 각 외부 호출 timeout 은 남은 시간에서 계산
+API_TIMEOUT = float(os.getenv("WELFARE_API_TIMEOUT", "5"))
+SOURCE_DEADLINE = float(os.getenv("WELFARE_SOURCE_DEADLINE", "15"))
+
+# 분기별로 풀을 분리해서 느린 LLM 작업이 API 조회를 막지 않게 한다
+_api_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("WELFARE_API_WORKERS", "16")),
+    thread_name_prefix="welfare-api",
+)
+_llm_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("WELFARE_LLM_WORKERS", "8")),
+    thread_name_prefix="welfare-llm",
+)
+
+
+def _fetch_cards(age: bool, city: str, deadline: float):
+    # 큐에서 기다린 시간을 빼고 남은 시간만 timeout 으로 사용
+    timeout = deadline - time.monotonic()
+    if timeout <= 0:
+        return []
+
     # 매핑
     srchKeyCode = "003"  # 서비스명+내용
 
@@ -33,19 +56,98 @@ def fetch_welfare_info(
         f"&ctpvNm={city}"
     )
 
-    #API 요청
-    response = requests.get(url)
+    #API 요청 - 결과는 헬스 모니터에도 기록해서 별도 probe 호출(일일 한도 소모)을 줄인다
+    started = time.perf_counter()
+    try:
+        response = requests.get(url, timeout=timeout)
+        check_data_go_kr_response(response)
+    except Exception as e:
+        health_monitor.record("data_go_kr", "down", f"{type(e).__name__}: {e} (live)",
+                              (time.perf_counter() - started) * 1000)
+        raise
+    health_monitor.record("data_go_kr", "up", "data.go.kr reachable (live)",
+                          (time.perf_counter() - started) * 1000)
     raw_info = response.text
 
-    cards = parse_and_format_cards(raw_info)
-    # if cards == []:
-    #     cards = summarize_welfare_info(city)
-    #     return cards
+    return parse_and_format_cards(raw_info)
+
 
+def _save_cards(city: str, cards, age):
     for i in cards:
         save_welfare_item(city, i, age)
+    return f"{len(cards)}의 정보가 등록됨"
 
 
-    return f"{len(cards)}의 정보가 등록됨"
+def _cards_or_empty(future):
+    # API 쪽 실패(네트워크/파싱 오류)는 "결과 없음"으로 보고 LLM 요약으로 넘긴다
+    try:
+        return future.result(timeout=0)
+    except Exception as e:
+        print(f"[welfare] 공공데이터 API 실패: {e}")
+        return []
+
+
+def _summary_or_none(future):
+    try:
+        return future.result(timeout=0)
+    except Exception as e:
+        print(f"[welfare] 요약 실패: {e}")
+        return None
+
+
+def fetch_welfare_info(
+    age: bool,
+    city: str,
+):
+    """
+    공공데이터 API 카드를 우선 사용하고, 비었거나 늦을 때만 검색+LLM 요약으로 대체
+    - API_TIMEOUT 안에 카드가 오면 LLM 은 아예 시작하지 않음
+    - API 가 비었거나 늦으면 LLM 요약을 시작하고, 늦은 API 와 마감 시간까지 경쟁
+    - 요약이 실패/빈 결과면 승리로 치지 않고 API 를 마감까지 계속 기다림
+    - 진 쪽은 cancel 이벤트로 LLM 호출 전에 멈추고, 모든 외부 호출은 마감 시각에 맞춘 timeout 사용
+    """
+    deadline = time.monotonic() + SOURCE_DEADLINE
+
+    api_future = _api_executor.submit(_fetch_cards, age, city, deadline)
+
+    # 1) 구조화된 카드만 API_TIMEOUT 까지 대기 (None = 아직 응답 없음)
+    cards = None
+    try:
+        cards = api_future.result(timeout=min(API_TIMEOUT, SOURCE_DEADLINE))
+    except FuturesTimeout:
+        pass
+    except Exception as e:
+        print(f"[welfare] 공공데이터 API 실패: {e}")
+        cards = []
+
+    if cards:
+        return _save_cards(city, cards, age)
+
+    # 2) API 가 비었거나 늦음 → 이제 LLM 요약 시작
+    cancel = threading.Event()
+    llm_future = _llm_executor.submit(summarize_welfare_info, city, cancel, deadline)
 
+    # 3) 마감까지 경쟁. 카드가 오면 카드, 쓸 만한 요약이 오면 요약.
+    #    한쪽이 빈손으로 끝나면(API 빈 결과, 요약 None/오류) 나머지를 계속 기다린다
+    pending = {llm_future} if cards is not None else {api_future, llm_future}
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if api_future in done:
+                cards = _cards_or_empty(api_future)
+                if cards:
+                    return _save_cards(city, cards, age)
+            if llm_future in done:
+                summary = _summary_or_none(llm_future)
+                if summary:
+                    return summary
+    finally:
+        # 진 쪽 정리: 요약은 LLM 호출 전에 멈추고, 아직 시작 안 한 작업은 취소
+        cancel.set()
+        llm_future.cancel()
+        api_future.cancel()
 
+    return f"{city} 관련 복지 정보를 시간 내에 찾지 못했습니다."
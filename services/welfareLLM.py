@@ -1,66 +1,67 @@
-from langchain_openai import ChatOpenAI
-import os
-from dotenv import load_dotenv
-from langchain_community.tools import DuckDuckGoSearchRun, DuckDuckGoSearchResults
-from langchain_community.utilities import DuckDuckGoSearchAPIWrapper
+import threading
+import time
+from typing import Optional
 
-
-# DuckDuckGo 검색 도구 초기화
-wrapper = DuckDuckGoSearchAPIWrapper(
-    region="kr-kr",      # 지역 편향 최소화 (예: "kr-kr", "us-en"도 가능)
-    safesearch="strict",    # off | moderate | strict
-    time="y",            # d | w | m | y (또는 None)
-    max_results=50,      # 더 많이 가져오기
-    backend="auto",      # api | html | lite | auto
-)
-
-# 문자열 하나(요약 스니펫)만 필요하면:
-search = DuckDuckGoSearchRun(api_wrapper=wrapper)
-
-
-load_dotenv()
-openai_api_key = os.getenv("OPENAI_API_KEY")
-SERVICE_KEY = os.getenv("DATA_SERVICE_KEY")
-
-# LLM 초기화
-llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.3)
+from services import registry
 
 
 # 시스템 프롬프트
 def load_income_prompt() -> str:
-    prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompt", "welfareprompt.txt")
-    with open(prompt_path, "r", encoding="utf-8") as f:
-        return f.read()
+    return registry.get("welfare_prompt")
 
 
 def summarize_welfare_info(
     city: str,
+    cancel: Optional[threading.Event] = None,
+    deadline: Optional[float] = None,
 ):
     """
     LangChain 기반: 지역 복지 정보를 DuckDuckGo로 검색하고 요약
+
+    cancel: set 되면 검색 후 LLM 호출을 생략하고 None 반환 (더 빠른 쪽이 이긴 경우)
+    deadline: time.monotonic() 기준 마감 시각. 검색/LLM timeout 을 남은 시간에서 계산한다.
+
+    쓸 만한 요약이 없으면(검색 결과 없음, 취소, 마감 초과, 오류) None 을 반환한다.
+    호출하는 쪽이 실패 메시지를 요약으로 착각하지 않게 하기 위함.
     """
     system_prompt = load_income_prompt()
 
     query = f"{city} 노인 복지 혜택 지원 사업"
 
+    def remaining() -> Optional[float]:
+        return None if deadline is None else deadline - time.monotonic()
+
     try:
-        # 1. DuckDuckGo 검색 결과 (구조화된 형태)
-        results = search.invoke(query)
+        # 1. DuckDuckGo 검색 결과
+        left = remaining()
+        if left is not None and left <= 0:
+            return None
+        search = registry.get("search")
+        results = search(query) if left is None else search(query, timeout=left)
 
         if not results or len(results) == 0:
-            return f"{region} 관련 복지 정보를 찾지 못했습니다."
-
-        print(results)
+            print(f"[welfare] {city} 검색 결과 없음")
+            return None
 
+        # 2. 검색 사이에 취소됐거나 마감이 지났으면 LLM 호출 생략
+        left = remaining()
+        if (cancel is not None and cancel.is_set()) or (left is not None and left <= 0):
+            return None
 
         prompt = system_prompt + results
 
-        response = llm.invoke(prompt)
+        llm = registry.get("llm")
+        if left is None:
+            response = llm.invoke(prompt)
+        else:
+            # 재시도까지 포함해 남은 시간 안에 끝나도록 시도당 timeout 을 나눈다
+            response = llm.invoke(prompt, timeout=left / (llm.max_retries + 1))
         return response.content.strip()
 
     except Exception as e:
-        return f"[오류] 처리 중 문제가 발생했습니다: {e}"
+        print(f"[welfare] 요약 처리 중 오류: {e}")
+        return None
 
 
 if __name__ == "__main__":
-    print(summarize_welfare_info('''경기도'''))
\ No newline at end of file
+    print(summarize_welfare_info('''경기도'''))
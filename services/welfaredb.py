@@ -43,7 +43,8 @@ def save_welfare_item(city: str, item: Dict[str, Any], age: int = None, table: s
         "contact":   _clean(item.get("전화문의") or item.get("contact")),
         "applicant": _clean(item.get("지원대상") or item.get("applicant")),
         "link":      _clean(item.get("바로가기") or item.get("link") or item.get("url")),
-        "city": city,
+        # 파티션 PK (id, created_at, city) 에 들어가므로 NULL 대신 ''
+        "city": _clean(city) or "",
         "age": age,
     }
 
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 프로젝트 루트를 import 경로에 추가 (services, database 패키지)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
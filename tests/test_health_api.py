@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("requests")
+pytest.importorskip("psycopg2")
+pytest.importorskip("flask")
+pytest.importorskip("flask_restx")
+
+from flask import Flask
+from flask_restx import Api
+
+from api import health
+from services import healthmonitor
+from services.healthmonitor import HealthMonitor, ProbeError
+
+
+def _fail():
+    raise ProbeError("down")
+
+
+def _client(monkeypatch, probes):
+    monkeypatch.setattr(healthmonitor, "CRITICAL", ["database"])
+    m = HealthMonitor()
+    for name, func in probes.items():
+        m.add_probe(name, func, interval=60)
+        m.run_once(name)
+    # 테스트에서는 백그라운드 스레드를 띄우지 않는다
+    monkeypatch.setattr(m, "start", lambda: None)
+    monkeypatch.setattr(health, "monitor", m)
+
+    app = Flask(__name__)
+    Api(app).add_namespace(health.health_ns, path="/health")
+    return app.test_client()
+
+
+def test_ready_503_when_critical_down(monkeypatch):
+    client = _client(monkeypatch, {"database": _fail, "openai": lambda: "ok"})
+    resp = client.get("/health/ready")
+    assert resp.status_code == 503
+    assert resp.get_json()["status"] == "not_ready"
+
+    resp = client.get("/health/status")
+    assert resp.status_code == 200
+    assert resp.get_json()["status"] == "unhealthy"
+
+
+def test_status_degraded_when_only_external_down(monkeypatch):
+    client = _client(monkeypatch, {"database": lambda: "ok", "openai": _fail})
+    assert client.get("/health/ready").status_code == 200
+
+    resp = client.get("/health/status")
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["status"] == "degraded"
+    assert body["checks"]["openai"]["status"] == "down"
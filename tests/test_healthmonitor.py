@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("requests")
+pytest.importorskip("psycopg2")
+
+from services import healthmonitor
+from services.healthmonitor import HealthMonitor, ProbeError
+
+
+def _fail():
+    raise ProbeError("connection refused")
+
+
+@pytest.fixture
+def critical(monkeypatch):
+    monkeypatch.setattr(healthmonitor, "CRITICAL", ["database"])
+
+
+def test_run_once_records_down_with_message(critical):
+    m = HealthMonitor()
+    m.add_probe("database", _fail, interval=60)
+    m.run_once("database")
+
+    result = m.snapshot()["database"]
+    assert result["status"] == "down"
+    assert "ProbeError: connection refused" in result["message"]
+    assert result["latency_ms"] is not None
+    assert result["checked_at"] is not None
+
+
+def test_snapshot_marks_old_results_stale(critical):
+    m = HealthMonitor()
+    m.add_probe("database", lambda: "ok", interval=0.01)
+    m.run_once("database")
+    assert m.snapshot()["database"]["status"] == "up"
+
+    time.sleep(0.01 * healthmonitor.STALE_FACTOR + 0.05)
+    assert m.snapshot()["database"]["status"] == "stale"
+    assert not m.is_ready()
+
+
+def test_is_ready_ignores_non_critical(critical):
+    m = HealthMonitor()
+    m.add_probe("database", lambda: "ok", interval=60)
+    m.add_probe("openai", _fail, interval=60)
+
+    # 아직 검사 전(unknown)이면 not ready
+    assert not m.is_ready()
+
+    m.run_once("database")
+    m.run_once("openai")
+    snapshot = m.snapshot()
+    assert snapshot["openai"]["status"] == "down"
+    assert snapshot["openai"]["critical"] is False
+    assert m.is_ready(snapshot)
+
+
+def test_recent_record_postpones_probe(critical):
+    calls = []
+    m = HealthMonitor()
+    m.add_probe("data_go_kr", lambda: calls.append(1) or "ok", interval=60)
+    assert m.seconds_until_due("data_go_kr") <= 0
+
+    # 실제 트래픽 결과가 기록되면 interval 동안 probe 를 생략한다
+    m.record("data_go_kr", "up", "live", 12.0)
+    assert m.seconds_until_due("data_go_kr") > 59
+    assert m.snapshot()["data_go_kr"]["message"] == "live"
+    assert calls == []
+
+
+def test_record_ignores_unknown_probe():
+    m = HealthMonitor()
+    m.record("nope", "up", "x")
+    assert m.snapshot() == {}
@@ -0,0 +1,134 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("psycopg2")
+
+from database import maintenance
+
+
+@pytest.mark.parametrize("start, n, expected", [
+    (date(2026, 11, 15), 1, date(2026, 12, 1)),
+    (date(2026, 11, 15), 2, date(2027, 1, 1)),
+    (date(2026, 12, 1), 13, date(2028, 1, 1)),
+    (date(2026, 1, 31), -1, date(2025, 12, 1)),
+    (date(2026, 3, 1), -15, date(2024, 12, 1)),
+])
+def test_add_months_crosses_year_boundaries(start, n, expected):
+    assert maintenance._add_months(start, n) == expected
+
+
+def test_parse_timestamp_defaults_to_utc():
+    assert maintenance._parse_timestamp("2025-01-01") == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    ts = maintenance._parse_timestamp("2025-01-01T09:00:00+09:00")
+    assert ts.utcoffset() == timedelta(hours=9)
+
+
+def test_partition_name_regex():
+    assert maintenance._PARTITION_NAME.search("welfare_item_p2025_03").groups() == ("2025", "03")
+    assert maintenance._PARTITION_NAME.search("welfare_item_default") is None
+    # city HASH 서브파티션은 월 파티션과 함께 지워지므로 직접 매칭되지 않아야 한다
+    assert maintenance._PARTITION_NAME.search("welfare_item_p2025_03_h1") is None
+
+
+def test_expired_partitions_only_whole_months_before_cutoff():
+    parts = [
+        "incomesnapshot_default",
+        "incomesnapshot_p2025_01",
+        "incomesnapshot_p2025_02",
+        "incomesnapshot_p2025_03",
+    ]
+    # 2025-03-01 이전 달(1, 2월)만 통째로 만료
+    assert maintenance._expired_partitions(parts, date(2025, 3, 1)) == [
+        "incomesnapshot_p2025_01", "incomesnapshot_p2025_02"]
+    # 2월 중간이 cutoff 면 2월 파티션에는 아직 보존할 행이 있다
+    assert maintenance._expired_partitions(parts, date(2025, 2, 15)) == ["incomesnapshot_p2025_01"]
+    assert maintenance._expired_partitions(["welfare_item_p2024_12"], date(2025, 1, 1)) == [
+        "welfare_item_p2024_12"]
+
+
+def test_created_at_source_is_explicit_or_whitelisted():
+    pick = maintenance._pick_created_at_source
+    assert pick(["deadline", "reg_date"]) == "reg_date"
+    # 마감일/생일 같은 다른 날짜는 추측해서 쓰지 않는다
+    assert pick(["deadline", "birth_date"]) is None
+    assert pick(["deadline", "reg_date"], "deadline") == "deadline"
+    with pytest.raises(RuntimeError):
+        pick(["reg_date"], "missing")
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    recorded = []
+
+    def fake_in_transaction(rollback, func, *args, **kwargs):
+        recorded.append((func.__name__, rollback, args, kwargs))
+
+    monkeypatch.setattr(maintenance, "_in_transaction", fake_in_transaction)
+    return recorded
+
+
+def _purges(calls):
+    return [(args, kwargs) for name, _, args, kwargs in calls if name == "purge_table"]
+
+
+def test_main_keeps_table_order(calls):
+    # 지정 순서와 상관없이 TABLES 순서 (snapshot → breaket) 로 처리
+    assert maintenance.main(["purge", "--table", "incomebreaket", "--table", "incomesnapshot"]) == 0
+    assert [args[0] for args, _ in _purges(calls)] == ["incomesnapshot", "incomebreaket"]
+
+
+def test_main_no_archive_and_retention_override(calls):
+    maintenance.main(["purge", "--no-archive", "--retention-days", "7", "--dry-run"])
+    purges = _purges(calls)
+    assert [args for args, _ in purges] == [(t, 7) for t in maintenance.TABLES]
+    assert all(kwargs == {"archive_dir": None, "dry_run": True} for _, kwargs in purges)
+    assert all(dry for _, dry, _, _ in calls)
+
+
+def test_main_default_retention_and_archive(calls):
+    maintenance.main(["purge", "--table", "welfare_item"])
+    assert _purges(calls) == [(
+        ("welfare_item", maintenance.RETENTION_DAYS["welfare_item"]),
+        {"archive_dir": maintenance.ARCHIVE_DIR, "dry_run": False},
+    )]
+
+
+def test_main_migrate_passes_created_at_options(calls):
+    maintenance.main(["migrate", "--table", "welfare_item", "--created-at-from", "reg_date",
+                      "--assume-created-at", "2025-01-01"])
+    assert calls == [("convert_to_partitioned", False, ("welfare_item",), {
+        "keep_legacy": False,
+        "assume_created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "created_at_from": "reg_date",
+    })]
+
+
+class _FakeConn:
+    def __init__(self):
+        self.events = []
+
+    def commit(self):
+        self.events.append("commit")
+
+    def rollback(self):
+        self.events.append("rollback")
+
+    def close(self):
+        self.events.append("close")
+
+
+def test_in_transaction_passes_dry_run_through(monkeypatch):
+    # purge_table 의 dry_run 인자가 _in_transaction 자체 인자와 겹치지 않아야 한다
+    conn = _FakeConn()
+    monkeypatch.setattr(maintenance, "get_connection", lambda: conn)
+    seen = {}
+
+    def job(c, table, dry_run=False):
+        seen.update(conn=c, table=table, dry_run=dry_run)
+        return 3
+
+    assert maintenance._in_transaction(True, job, "welfare_item", dry_run=True) == 3
+    assert seen == {"conn": conn, "table": "welfare_item", "dry_run": True}
+    assert conn.events == ["rollback", "close"]
@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from services import registry
+
+
+@pytest.fixture
+def names():
+    created = []
+    yield created
+    for name in created:
+        registry._factories.pop(name, None)
+        registry._instances.pop(name, None)
+        registry._locks.pop(name, None)
+
+
+def test_factory_runs_once_and_is_shared(names):
+    calls = []
+    names.append("test_once")
+
+    @registry.register("test_once")
+    def _factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry.get("test_once"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert registry.is_loaded("test_once")
+
+
+def test_slow_factory_does_not_block_other_services(names):
+    names.extend(["test_slow", "test_fast"])
+    release = threading.Event()
+
+    @registry.register("test_slow")
+    def _slow():
+        release.wait(5)
+        return "slow"
+
+    @registry.register("test_fast")
+    def _fast():
+        return "fast"
+
+    t = threading.Thread(target=registry.get, args=("test_slow",))
+    t.start()
+    try:
+        time.sleep(0.05)
+        started = time.monotonic()
+        assert registry.get("test_fast") == "fast"
+        assert time.monotonic() - started < 1.0
+    finally:
+        release.set()
+        t.join()
+
+
+def test_failed_factory_is_retried(names):
+    names.append("test_retry")
+    attempts = []
+
+    @registry.register("test_retry")
+    def _flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        registry.get("test_retry")
+    assert registry.get("test_retry") == "ok"
+
+
+def test_unknown_service_raises():
+    with pytest.raises(KeyError):
+        registry.get("no_such_service")
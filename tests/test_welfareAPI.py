@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("requests")
+pytest.importorskip("psycopg2")
+
+from services import welfareAPI
+
+CARD = {"제목": "노인 돌봄 지원", "요약": "요약", "바로가기": "https://example.com"}
+SAVED = "1의 정보가 등록됨"
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    """
+    API/LLM 분기를 가짜로 바꾼다.
+    가짜 요약은 실제 summarize_welfare_info 처럼 검색 → cancel 확인 → LLM 호출 순서로 동작하고,
+    llm_calls(분기 시작)와 invokes(LLM 호출)를 따로 센다.
+    """
+    state = {
+        "api_delay": 0.0,
+        "api_cards": [CARD],
+        "search_delay": 0.0,
+        "llm_delay": 0.0,
+        "summary": "SUMMARY",
+        "llm_calls": 0,
+        "invokes": 0,
+        "cancels": [],
+    }
+    lock = threading.Lock()
+
+    def fake_fetch(age, city, deadline):
+        time.sleep(state["api_delay"])
+        return list(state["api_cards"])
+
+    def fake_summary(city, cancel=None, deadline=None):
+        with lock:
+            state["llm_calls"] += 1
+            state["cancels"].append(cancel)
+        time.sleep(state["search_delay"])
+        if cancel is not None and cancel.is_set():
+            return None
+        if isinstance(state["summary"], Exception):
+            raise state["summary"]
+        with lock:
+            state["invokes"] += 1
+        time.sleep(state["llm_delay"])
+        return state["summary"]
+
+    monkeypatch.setattr(welfareAPI, "_fetch_cards", fake_fetch)
+    monkeypatch.setattr(welfareAPI, "summarize_welfare_info", fake_summary)
+    monkeypatch.setattr(welfareAPI, "save_welfare_item", lambda city, item, age: 1)
+    monkeypatch.setattr(welfareAPI, "API_TIMEOUT", 0.2)
+    monkeypatch.setattr(welfareAPI, "SOURCE_DEADLINE", 2.0)
+    return state
+
+
+def test_fast_api_does_not_call_llm(sources):
+    for _ in range(10):
+        assert welfareAPI.fetch_welfare_info(1, "강남구") == SAVED
+    assert sources["llm_calls"] == 0
+
+
+def test_empty_api_falls_back_to_summary(sources):
+    sources["api_cards"] = []
+    assert welfareAPI.fetch_welfare_info(1, "강남구") == "SUMMARY"
+    assert sources["invokes"] == 1
+
+
+def test_slow_api_loses_to_fast_summary(sources):
+    sources["api_delay"] = 1.0
+    assert welfareAPI.fetch_welfare_info(1, "강남구") == "SUMMARY"
+
+
+def test_late_api_beats_llm_and_cancels_invoke(sources):
+    # API 가 API_TIMEOUT 은 넘겼지만 검색이 끝나기 전에 도착
+    sources["api_delay"] = 0.4
+    sources["search_delay"] = 0.6
+    assert welfareAPI.fetch_welfare_info(1, "강남구") == SAVED
+    assert sources["llm_calls"] == 1
+    assert sources["cancels"][0].is_set()
+    # 검색이 끝난 뒤에도 LLM 은 호출되지 않아야 한다
+    time.sleep(0.5)
+    assert sources["invokes"] == 0
+
+
+@pytest.mark.parametrize("summary", [None, RuntimeError("202 Ratelimit")])
+def test_failed_summary_keeps_waiting_for_api(sources, summary):
+    sources["api_delay"] = 0.6
+    sources["summary"] = summary
+    assert welfareAPI.fetch_welfare_info(1, "강남구") == SAVED
+
+
+def test_both_branches_miss_deadline(sources, monkeypatch):
+    monkeypatch.setattr(welfareAPI, "SOURCE_DEADLINE", 0.5)
+    sources["api_delay"] = 1.5
+    sources["search_delay"] = 1.5
+    started = time.monotonic()
+    result = welfareAPI.fetch_welfare_info(1, "강남구")
+    assert result == "강남구 관련 복지 정보를 시간 내에 찾지 못했습니다."
+    assert time.monotonic() - started < 1.0